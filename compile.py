@@ -3,7 +3,7 @@
 Cross-platform compile script for building the project.
 Replaces compile.ps1 and compile.sh.
 
-Usage: python compile.py [-v|--verbose] [-l|--log] [-d|--deb] [-r|--rpm] [-p|--pacman] [--nogui]
+Usage: python compile.py [-v|--verbose] [-l|--log] [-d|--deb] [-r|--rpm] [-p|--pacman] [--nogui] [-j N] [--no-sccache]
 
 Options:
     -v, --verbose   Show full command output
@@ -12,21 +12,27 @@ Options:
     -r, --rpm       Force .rpm bundle (Linux only)
     -p, --pacman    Build Arch Linux .pkg.tar.zst package
     --nogui         Exclude GUI from Arch package (GUI included by default)
+    -j, --jobs N    Run up to N independent build steps in parallel (default: 3)
+    --no-sccache    Don't wrap rustc with sccache even if it is installed
 """
 from __future__ import annotations
 
 import argparse
-import glob
-import io
+import functools
+import mmap
 import os
 import platform
 import re
 import shutil
 import subprocess
 import sys
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import io
 
 # ANSI color codes
 GREEN = "\033[32m"
@@ -34,41 +40,116 @@ YELLOW = "\033[33m"
 RED = "\033[31m"
 RESET = "\033[0m"
 
+# Log file write buffer size; log_write does not flush on every line
+LOG_BUFFER_SIZE = 64 * 1024
+# Initial file size reserved for the memory-mapped log (Linux)
+LOG_MMAP_RESERVE = 16 * 1024 * 1024
+# Pipe read size when streaming command output
+STREAM_CHUNK_SIZE = 8192
+
 # Global state
 VERBOSE: bool = False
 LOG_ENABLED: bool = False
 LOG_FILE: Optional[Path] = None
-LOG_HANDLE: Optional[io.TextIOWrapper] = None
-
-ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+LOG_HANDLE: Optional[io.TextIOWrapper | MmapLogWriter] = None
+# Wrap rustc with sccache when available, as test.py does, so both scripts
+# share the debug build artifacts (--no-sccache turns it off)
+USE_SCCACHE: bool = True
+# Serializes terminal/log output from steps running in parallel
+OUTPUT_LOCK = threading.Lock()
+
+# CSI sequences only: SGR colors plus the cursor/erase codes progress bars use
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[A-Za-z]')
+# KEY=value or KEY="value" lines in /etc/os-release
+OS_RELEASE_LINE = re.compile(rb'^([A-Z0-9_]+)="?([^"\n]*)"?$', re.M)
 
 def strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from text."""
+    # Most lines carry no escape codes; skip the regex scan for them
+    if '\x1b' not in text:
+        return text
     return ANSI_ESCAPE.sub('', text)
 
+class MmapLogWriter:
+    """
+    Append-only UTF-8 log file backed by a shared memory map.
+    
+    Writes are copies into the mapping rather than write() syscalls; the
+    kernel writes the pages back on its own. The file is reserved up front,
+    grown by doubling when full, and trimmed to the written length on close.
+    """
+    
+    def __init__(self, path: Path, reserve: int = LOG_MMAP_RESERVE) -> None:
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(self._fd, reserve)
+            self._map = mmap.mmap(self._fd, reserve, flags=mmap.MAP_SHARED,
+                                  prot=mmap.PROT_READ | mmap.PROT_WRITE)
+        except (OSError, ValueError):
+            os.close(self._fd)
+            raise
+        self._size = reserve
+        self._offset = 0
+    
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8")
+        end = self._offset + len(data)
+        if end > self._size:
+            size = self._size
+            while size < end:
+                size *= 2
+            # Extends the file and remaps it
+            self._map.resize(size)
+            self._size = size
+        self._map[self._offset:end] = data
+        self._offset = end
+        return len(text)
+    
+    def flush(self) -> None:
+        # Mapped pages are already visible to readers of the file
+        pass
+    
+    def close(self) -> None:
+        self._map.close()
+        os.ftruncate(self._fd, self._offset)
+        os.close(self._fd)
+
+def decode_output(data: bytes) -> str:
+    """Decode raw command output for the log, normalizing CRLF line endings."""
+    text = data.decode('utf-8', errors='replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    return text
+
 def log_write(text: str) -> None:
     """Write to log file if enabled, stripping ANSI codes."""
-    global LOG_HANDLE
-    if LOG_HANDLE:
-        LOG_HANDLE.write(strip_ansi(text))
-        LOG_HANDLE.flush()
+    handle = LOG_HANDLE
+    if handle:
+        handle.write(strip_ansi(text))
 
 def print_and_log(text: str) -> None:
     """Print to terminal and optionally log."""
-    print(text)
-    log_write(text + "\n")
+    with OUTPUT_LOCK:
+        print(text)
+        log_write(text + "\n")
 
 def step(name: str) -> None:
     """Print a step header."""
     msg = f"{GREEN}==> {name}{RESET}"
-    print(msg)
-    log_write(f"==> {name}\n")
+    with OUTPUT_LOCK:
+        print(msg)
+        if LOG_HANDLE:
+            # Flush at step boundaries so partial logs stay useful
+            LOG_HANDLE.flush()
+        log_write(f"==> {name}\n")
 
 def run_cmd(cmd, shell: bool = False, check: bool = True, 
-            cwd: Optional[str] = None, quiet: bool = False) -> Optional[subprocess.CompletedProcess]:
+            cwd: Optional[str] = None, quiet: bool = False) -> Optional[int]:
     """
     Run a command with output handling.
     
+    Returns the exit code, or None if the command was not found (check=False).
+    
     When VERBOSE: stream output in real-time to terminal AND to log file
     When LOG_ENABLED (without VERBOSE): stream output but only log step headers
     When quiet and not VERBOSE: suppress stdout
@@ -81,32 +162,53 @@ def run_cmd(cmd, shell: bool = False, check: bool = True,
     
     try:
         if show_output:
-            # Stream output line by line for real-time display and logging
+            # Stream output in chunks for real-time display and logging
             process = subprocess.Popen(
                 cmd,
                 shell=shell,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
                 cwd=cwd,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1
+                bufsize=STREAM_CHUNK_SIZE
             )
+            # Bytes go to the terminal untouched; only the log needs text
+            out = sys.stdout.buffer
+            # Redirected output (CI logs, pipes) has no one watching live;
+            # let the stdout buffer batch it instead of flushing every chunk
+            interactive = out.isatty()
+            pending = b''
             
-            for line in process.stdout:
-                # Always print to terminal when verbose or logging
-                print(line, end='')
-                # Write to log file when VERBOSE (captures all command output)
-                if VERBOSE:
-                    log_write(line)
+            while True:
+                # read1 returns whatever is available instead of waiting for a full chunk
+                chunk = process.stdout.read1(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                with OUTPUT_LOCK:
+                    # Always print to terminal when verbose or logging
+                    sys.stdout.flush()
+                    out.write(chunk)
+                    if interactive:
+                        out.flush()
+                    # Write to log file when VERBOSE (captures all command output)
+                    if VERBOSE:
+                        # Log whole lines only so characters and escape codes are never split
+                        pending += chunk
+                        cut = pending.rfind(b'\n') + 1
+                        if cut:
+                            log_write(decode_output(pending[:cut]))
+                            pending = pending[cut:]
+            
+            with OUTPUT_LOCK:
+                out.flush()
+                if VERBOSE and pending:
+                    log_write(decode_output(pending))
             
             process.wait()
             
             if check and process.returncode != 0:
                 raise subprocess.CalledProcessError(process.returncode, cmd)
             
-            return subprocess.CompletedProcess(cmd, process.returncode)
+            return process.returncode
         
         elif quiet:
             # Quiet mode: suppress stdout, but capture for potential logging
@@ -121,7 +223,7 @@ def run_cmd(cmd, shell: bool = False, check: bool = True,
                 errors='replace',
                 check=check
             )
-            return result
+            return result.returncode
         
         else:
             # Normal mode: let output flow through
@@ -134,21 +236,29 @@ def run_cmd(cmd, shell: bool = False, check: bool = True,
                 errors='replace',
                 check=check
             )
-            return result
+            return result.returncode
     
     except subprocess.CalledProcessError as e:
         if check:
             raise
-        return e
+        return e.returncode
     except FileNotFoundError as e:
         print_and_log(f"{RED}Command not found: {cmd}{RESET}")
         if check:
             raise
         return None
 
+@functools.lru_cache(maxsize=1)
+def _system() -> str:
+    """Return platform.system(), computed once per run."""
+    return platform.system()
+
+@functools.lru_cache(maxsize=None)
 def command_exists(name: str) -> bool:
+    # Cached; call command_exists.cache_clear() after changing PATH
     return shutil.which(name) is not None
 
+@functools.lru_cache(maxsize=1)
 def get_host_triple() -> str:
     """Get the Rust host triple."""
     try:
@@ -165,7 +275,7 @@ def get_host_triple() -> str:
         pass
     
     # Fallback
-    system = platform.system()
+    system = _system()
     if system == "Windows":
         return "x86_64-pc-windows-msvc"
     elif system == "Darwin":
@@ -173,20 +283,20 @@ def get_host_triple() -> str:
     else:
         return "x86_64-unknown-linux-gnu"
 
+@functools.lru_cache(maxsize=1)
 def get_distro_info() -> dict:
     """Get Linux distribution info from /etc/os-release."""
-    info_dict = {}
     os_release = Path("/etc/os-release")
-    if os_release.exists():
-        for line in os_release.read_text().splitlines():
-            if "=" in line:
-                key, _, value = line.partition("=")
-                info_dict[key] = value.strip('"')
-    return info_dict
+    try:
+        data = os_release.read_bytes()
+    except OSError:
+        return {}
+    return {m.group(1).decode(): m.group(2).decode(errors="replace")
+            for m in OS_RELEASE_LINE.finditer(data)}
 
 def is_arch_based() -> bool:
     """Detect if running on Arch Linux or a derivative."""
-    if platform.system() != "Linux":
+    if _system() != "Linux":
         return False
     distro = get_distro_info()
     distro_id = distro.get("ID", "").lower()
@@ -199,17 +309,8 @@ def is_arch_based() -> bool:
         return True
     return False
 
-def generate_pkgbuild(version: str = "0.1.0", include_gui: bool = False) -> Path:
-    """Generate PKGBUILD file for building Arch package."""
-    # Use absolute paths since makepkg creates a src/ subdir
-    project_root = Path.cwd().resolve()
-    cli_binary_path = project_root / "target" / "release" / "website-searcher"
-    gui_binary_path = project_root / "target" / "release" / "website-searcher-gui"
-    license_path = project_root / "LICENSE"
-    ws_script_path = project_root / "scripts" / "ws"
-    
-    # Build the package() function contents
-    install_commands = f'''    # Install CLI binary
+# PKGBUILD templates, filled with str.format_map in generate_pkgbuild
+PKGBUILD_CLI_INSTALL = '''    # Install CLI binary
     install -Dm755 "{cli_binary_path}" "$pkgdir/usr/bin/website-searcher"
     ln -s website-searcher "$pkgdir/usr/bin/websearcher"
     
@@ -217,29 +318,20 @@ def generate_pkgbuild(version: str = "0.1.0", include_gui: bool = False) -> Path
     if [ -f "{ws_script_path}" ]; then
         install -Dm755 "{ws_script_path}" "$pkgdir/usr/bin/ws"
     fi'''
-    
-    if include_gui:
-        install_commands += f'''
-    
-    # Install GUI binary
+
+PKGBUILD_GUI_INSTALL = '''    # Install GUI binary
     if [ -f "{gui_binary_path}" ]; then
         install -Dm755 "{gui_binary_path}" "$pkgdir/usr/bin/website-searcher-gui"
     fi'''
-    
-    install_commands += f'''
-    
-    # Install license
+
+PKGBUILD_LICENSE_INSTALL = '''    # Install license
     if [ -f "{license_path}" ]; then
         install -Dm644 "{license_path}" "$pkgdir/usr/share/licenses/$pkgname/LICENSE"
     fi'''
-    
-    provides = "'website-searcher' 'websearcher' 'ws'"
-    if include_gui:
-        provides += " 'website-searcher-gui'"
-    
-    pkgbuild_content = f'''# Maintainer: Auto-generated
+
+PKGBUILD_TEMPLATE = '''# Maintainer: Auto-generated
 pkgname=website-searcher
-pkgver={version.replace('-', '_')}
+pkgver={pkgver}
 pkgrel=1
 pkgdesc="Cross-platform CLI that queries multiple game-download sites"
 arch=('x86_64')
@@ -253,6 +345,34 @@ package() {{
 {install_commands}
 }}
 '''
+
+def generate_pkgbuild(version: str = "0.1.0", include_gui: bool = False) -> Path:
+    """Generate PKGBUILD file for building Arch package."""
+    # Use absolute paths since makepkg creates a src/ subdir
+    project_root = Path.cwd().resolve()
+    paths = {
+        "cli_binary_path": project_root / "target" / "release" / "website-searcher",
+        "gui_binary_path": project_root / "target" / "release" / "website-searcher-gui",
+        "license_path": project_root / "LICENSE",
+        "ws_script_path": project_root / "scripts" / "ws",
+    }
+    
+    # Build the package() function contents
+    parts = [PKGBUILD_CLI_INSTALL]
+    if include_gui:
+        parts.append(PKGBUILD_GUI_INSTALL)
+    parts.append(PKGBUILD_LICENSE_INSTALL)
+    install_commands = "\n    \n".join(part.format_map(paths) for part in parts)
+    
+    provides = "'website-searcher' 'websearcher' 'ws'"
+    if include_gui:
+        provides += " 'website-searcher-gui'"
+    
+    pkgbuild_content = PKGBUILD_TEMPLATE.format_map({
+        "pkgver": version.replace('-', '_'),
+        "provides": provides,
+        "install_commands": install_commands,
+    })
     pkg_dir = Path("pkg")
     pkg_dir.mkdir(exist_ok=True)
     pkgbuild_path = pkg_dir / "PKGBUILD"
@@ -292,12 +412,26 @@ def build_pacman_package(include_gui: bool = False) -> None:
         print_and_log(f"{YELLOW}makepkg failed: {e}{RESET}")
 
 def ensure_cargo_in_path() -> None:
-    """Add cargo bin to PATH if not already present."""
+    """Add cargo bin to PATH if not already present and set up sccache."""
     cargo_bin = Path.home() / ".cargo" / "bin"
     if cargo_bin.exists():
-        path_sep = ";" if platform.system() == "Windows" else ":"
-        if str(cargo_bin) not in os.environ.get("PATH", ""):
-            os.environ["PATH"] = f"{cargo_bin}{path_sep}{os.environ.get('PATH', '')}"
+        path_entries = os.environ.get("PATH", "").split(os.pathsep)
+        cargo_str = str(cargo_bin)
+        if cargo_str not in path_entries:
+            os.environ["PATH"] = os.pathsep.join([cargo_str, *path_entries])
+            command_exists.cache_clear()
+    if USE_SCCACHE:
+        enable_sccache()
+
+def enable_sccache() -> None:
+    """Route rustc through sccache if it's installed and no wrapper is configured."""
+    # An explicit RUSTC_WRAPPER, even an empty one, is the user's choice
+    if "RUSTC_WRAPPER" in os.environ:
+        return
+    sccache = shutil.which("sccache")
+    if sccache:
+        os.environ["RUSTC_WRAPPER"] = sccache
+        os.environ.setdefault("SCCACHE_DIR", str(Path.home() / ".cache" / "sccache"))
 
 def ensure_node_modules() -> None:
     """Ensure node_modules are set up."""
@@ -312,11 +446,17 @@ def ensure_node_modules() -> None:
 
 def cleanup_old_logs(max_logs: int = 3) -> None:
     """Keep only the N most recent log files, delete older ones."""
-    log_pattern = "compile-script-*.log"
-    log_files = sorted(glob.glob(log_pattern), key=os.path.getmtime, reverse=True)
+    # One directory read; DirEntry.stat() avoids a second stat per file
+    with os.scandir(".") as it:
+        entries = [
+            (entry.stat().st_mtime, entry.name)
+            for entry in it
+            if entry.name.startswith("compile-script-") and entry.name.endswith(".log")
+        ]
+    entries.sort(reverse=True)
     
     # Delete all but the most recent max_logs files
-    for old_log in log_files[max_logs:]:
+    for _, old_log in entries[max_logs:]:
         try:
             os.remove(old_log)
             print_and_log(f"Removed old log: {old_log}")
@@ -327,32 +467,56 @@ def setup_logging() -> None:
     """Set up log file with UTF-8 encoding."""
     global LOG_FILE, LOG_HANDLE
     
+    from datetime import datetime
+    
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     LOG_FILE = Path(f"compile-script-{timestamp}.log")
-    LOG_HANDLE = open(LOG_FILE, "w", encoding="utf-8")
+    LOG_HANDLE = None
+    if _system() == "Linux":
+        try:
+            LOG_HANDLE = MmapLogWriter(LOG_FILE)
+        except (OSError, ValueError):
+            pass  # Fall back to a buffered file below
+    if LOG_HANDLE is None:
+        LOG_HANDLE = open(LOG_FILE, "w", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
     print_and_log(f"Logging to: {LOG_FILE}")
 
 def close_logging() -> None:
     """Close log file handle."""
     global LOG_HANDLE
     if LOG_HANDLE:
+        LOG_HANDLE.flush()
         LOG_HANDLE.close()
         LOG_HANDLE = None
 
+def run_parallel(steps, jobs: int) -> None:
+    """Run independent build steps concurrently, at most `jobs` at a time."""
+    if jobs <= 1:
+        for fn in steps:
+            fn()
+        return
+    
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(fn) for fn in steps]
+        # Re-raise the first failure (e.g. CalledProcessError) in submission order
+        for future in futures:
+            future.result()
+
 # ============================================================
 # Build steps
 # ============================================================
 
-def cargo_q() -> str:
-    """Return -q flag if not verbose."""
-    return "" if VERBOSE else "-q"
+def cargo_cmd(*args: str) -> list[str]:
+    """Build a cargo command line, adding -q when not verbose."""
+    return ["cargo", *(() if VERBOSE else ("-q",)), *args]
 
 def check_formatting() -> None:
     """Check and fix formatting."""
+    # Only the exit code matters; let the kernel discard the diff output
     result = subprocess.run(
         ["cargo", "fmt", "--all", "--", "--check"],
-        capture_output=True,
-        text=True
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
     
     if result.returncode == 0:
@@ -364,38 +528,22 @@ def check_formatting() -> None:
 def run_clippy() -> None:
     """Run clippy linter."""
     step("Clippy")
-    q = cargo_q()
-    cmd = ["cargo", "clippy", "--all-targets"]
-    if q:
-        cmd.insert(1, q)
-    run_cmd(cmd)
+    run_cmd(cargo_cmd("clippy", "--all-targets", "--no-deps"))
 
 def build_cli_release() -> None:
     """Build CLI in release mode."""
     step("Build CLI (release)")
-    q = cargo_q()
-    cmd = ["cargo", "build", "-p", "website-searcher", "--release"]
-    if q:
-        cmd.insert(1, q)
-    run_cmd(cmd)
+    run_cmd(cargo_cmd("build", "-p", "website-searcher", "--release"))
 
 def build_cli_debug() -> None:
     """Build CLI in debug mode."""
     step("Build CLI (debug)")
-    q = cargo_q()
-    cmd = ["cargo", "build", "-p", "website-searcher"]
-    if q:
-        cmd.insert(1, q)
-    run_cmd(cmd)
+    run_cmd(cargo_cmd("build", "-p", "website-searcher"))
 
 def build_workspace_release() -> None:
     """Build entire workspace in release mode."""
     step("Build workspace (release)")
-    q = cargo_q()
-    cmd = ["cargo", "build", "--workspace", "--release"]
-    if q:
-        cmd.insert(1, q)
-    run_cmd(cmd)
+    run_cmd(cargo_cmd("build", "--workspace", "--release"))
 
 def stage_tauri_sidecar() -> None:
     """Stage CLI binary as Tauri sidecar."""
@@ -405,7 +553,7 @@ def stage_tauri_sidecar() -> None:
     bin_dir = Path("src-tauri/bin")
     bin_dir.mkdir(parents=True, exist_ok=True)
     
-    system = platform.system()
+    system = _system()
     if system == "Windows":
         src = Path("target/release/website-searcher.exe")
         dst = bin_dir / f"website-searcher-{triple}.exe"
@@ -414,14 +562,17 @@ def stage_tauri_sidecar() -> None:
         dst = bin_dir / f"website-searcher-{triple}"
     
     if src.exists():
-        shutil.copy2(src, dst)
+        # Timestamps are irrelevant for a binary that gets re-bundled
+        shutil.copyfile(src, dst)
+        if system != "Windows":
+            os.chmod(dst, 0o755)
         print_and_log(f"Staged sidecar: {dst}")
     else:
         print_and_log(f"{YELLOW}Warning: Source binary not found: {src}{RESET}")
 
 def stage_wix_inputs() -> None:
     """Stage WiX inputs for Windows MSI build."""
-    if platform.system() != "Windows":
+    if _system() != "Windows":
         return
     
     step("Stage WiX inputs")
@@ -436,12 +587,12 @@ def stage_wix_inputs() -> None:
     
     src_exe = Path("target/release/website-searcher.exe")
     if src_exe.exists():
-        shutil.copy2(src_exe, wix_bin / "website-searcher.exe")
-    shutil.copy2(ws_cmd, wix_bin / "ws.cmd")
+        shutil.copyfile(src_exe, wix_bin / "website-searcher.exe")
+    shutil.copyfile(ws_cmd, wix_bin / "ws.cmd")
 
 def normalize_linux_scripts() -> None:
     """Normalize Linux maintainer scripts (remove CR, ensure shebang)."""
-    if platform.system() == "Windows":
+    if _system() == "Windows":
         return
     
     scripts = [
@@ -455,15 +606,19 @@ def normalize_linux_scripts() -> None:
         if not path.exists():
             continue
         
-        content = path.read_text()
+        content = path.read_bytes()
         # Remove CR
-        content = content.replace('\r', '')
+        normalized = content.replace(b'\r', b'')
         # Ensure shebang
-        if not content.startswith('#!'):
-            content = '#!/bin/sh\n' + content
-        path.write_text(content)
+        if not normalized.startswith(b'#!'):
+            normalized = b'#!/bin/sh\n' + normalized
+        # Only rewrite scripts that actually changed
+        if normalized != content:
+            path.write_bytes(normalized)
         # Make executable
-        path.chmod(path.stat().st_mode | 0o755)
+        mode = path.stat().st_mode
+        if mode & 0o755 != 0o755:
+            path.chmod(mode | 0o755)
 
 def determine_linux_bundles(want_deb: bool, want_rpm: bool) -> str:
     """Determine which Linux bundles to build."""
@@ -497,14 +652,14 @@ def build_tauri(want_deb: bool = False, want_rpm: bool = False) -> None:
     
     # Check if tauri-cli is available
     try:
-        subprocess.run(["cargo", "tauri", "--version"], capture_output=True, check=True)
+        subprocess.run(["cargo", "tauri", "--version"],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
         print_and_log(f"{YELLOW}cargo-tauri not found; skipping bundling.{RESET}")
         print_and_log("Install with: cargo install tauri-cli --locked")
         return
     
-    system = platform.system()
-    q = cargo_q()
+    system = _system()
     
     if system == "Windows":
         bundles = "msi"
@@ -520,9 +675,7 @@ def build_tauri(want_deb: bool = False, want_rpm: bool = False) -> None:
     if system == "Linux":
         os.environ["APPIMAGE_EXTRACT_AND_RUN"] = "1"
     
-    cmd = ["cargo", "tauri", "build", "--bundles", bundles]
-    if q:
-        cmd.insert(1, q)
+    cmd = cargo_cmd("tauri", "build", "--bundles", bundles)
     
     try:
         run_cmd(cmd, cwd="src-tauri")
@@ -534,7 +687,7 @@ def build_tauri(want_deb: bool = False, want_rpm: bool = False) -> None:
 
 def manual_link_msi() -> None:
     """Manually link MSI if Tauri build fails on Windows."""
-    if platform.system() != "Windows":
+    if _system() != "Windows":
         return
     
     wix_root = Path(os.environ.get("LOCALAPPDATA", "")) / "tauri/WixTools314"
@@ -564,7 +717,7 @@ def manual_link_msi() -> None:
         "-arch", "x64", "-out", str(obj.parent) + "\\", str(wxs)
     ], cwd="src-tauri", check=False)
     
-    if result and result.returncode != 0:
+    if result is not None and result != 0:
         print_and_log(f"{YELLOW}candle.exe failed{RESET}")
         return
     
@@ -579,7 +732,7 @@ def manual_link_msi() -> None:
 # ============================================================
 
 def main() -> int:
-    global VERBOSE, LOG_ENABLED
+    global VERBOSE, LOG_ENABLED, USE_SCCACHE
     
     parser = argparse.ArgumentParser(description="Build the project")
     parser.add_argument("-v", "--verbose", action="store_true", help="Show full command output")
@@ -588,10 +741,15 @@ def main() -> int:
     parser.add_argument("-r", "--rpm", action="store_true", help="Force .rpm bundle (Linux)")
     parser.add_argument("-p", "--pacman", action="store_true", help="Build Arch Linux .pkg.tar.zst package")
     parser.add_argument("--nogui", action="store_true", help="Exclude GUI from Arch package")
+    parser.add_argument("-j", "--jobs", type=int, default=3, metavar="N",
+                        help="Run up to N independent build steps in parallel (default: 3)")
+    parser.add_argument("--no-sccache", action="store_true",
+                        help="Don't wrap rustc with sccache even if it is installed")
     args = parser.parse_args()
     
     VERBOSE = args.verbose
     LOG_ENABLED = args.log
+    USE_SCCACHE = not args.no_sccache
     
     # Set up logging if enabled
     if LOG_ENABLED:
@@ -613,15 +771,13 @@ def main() -> int:
         # Build CLI first (needed for sidecar)
         build_cli_release()
         
-        # Stage sidecar and WiX inputs
-        stage_wix_inputs()
-        stage_tauri_sidecar()
-        
-        # Lint
-        run_clippy()
+        # Stage sidecar and WiX inputs; src-tauri's build script requires the
+        # sidecar, so this must finish before clippy or the workspace build
+        jobs = max(1, args.jobs)
+        run_parallel([stage_wix_inputs, stage_tauri_sidecar], jobs=jobs)
         
-        # Debug build (for development)
-        build_cli_debug()
+        # Lint alongside the debug build (for development)
+        run_parallel([run_clippy, build_cli_debug], jobs=jobs)
         
         # Build workspace
         build_workspace_release()
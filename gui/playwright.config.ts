@@ -4,6 +4,8 @@ export default defineConfig({
   testDir: "./e2e",
   timeout: 30000,
   retries: process.env.CI ? 2 : 0,
+  // Worker cap from test.py when it runs `pnpm ci:test` alongside cargo
+  workers: Number(process.env.PLAYWRIGHT_WORKERS) || undefined,
   reporter: "html",
   use: {
     // Use Vite's default dev server port
@@ -1,6 +1,9 @@
 import { defineConfig } from "vitest/config";
 import react from "@vitejs/plugin-react";
 
+// Worker cap from test.py when it runs `pnpm ci:test` alongside cargo
+const maxWorkers = Number(process.env.VITEST_MAX_WORKERS) || undefined;
+
 export default defineConfig({
   plugins: [react()],
   test: {
@@ -8,6 +11,8 @@ export default defineConfig({
     globals: true,
     setupFiles: ["./src/test/setup.ts"],
     include: ["src/**/*.{test,spec}.{ts,tsx}"],
+    minWorkers: maxWorkers && 1,
+    maxWorkers,
     coverage: {
       provider: "v8",
       reporter: ["text", "html"],
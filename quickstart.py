@@ -6,12 +6,17 @@ Replaces quickstart.ps1 and quickstart.sh.
 Usage: python quickstart.py [--install-coverage]
 """
 
+import functools
 import os
 import platform
+import shlex
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 # ANSI color codes
 CYAN = "\033[36m"
@@ -20,17 +25,59 @@ RED = "\033[31m"
 GREEN = "\033[32m"
 RESET = "\033[0m"
 
+# Host platform, looked up once
+_SYSTEM = platform.system()
+IS_WINDOWS = _SYSTEM == "Windows"
+IS_LINUX = _SYSTEM == "Linux"
+IS_DARWIN = _SYSTEM == "Darwin"
+
+# rustup's install location
+CARGO_HOME = Path.home() / ".cargo"
+CARGO_BIN = CARGO_HOME / "bin"
+
+# Cargo tools installed by main(): (display name, binary, crate, extra args)
+CARGO_TOOLS = [
+    ("Tauri CLI", "cargo-tauri", "tauri-cli", "--locked"),
+    ("cargo-audit", "cargo-audit", "cargo-audit", ""),
+    ("cargo-nextest", "cargo-nextest", "cargo-nextest", ""),
+    ("cargo-llvm-cov", "cargo-llvm-cov", "cargo-llvm-cov", ""),
+]
+
+# Tools reported by print_versions(): (label, binary on PATH, version arguments)
+VERSION_PROBES = [
+    ("node", "node", ["-v"]),
+    ("npm", "npm", ["-v"]),
+    ("pnpm", "pnpm", ["-v"]),
+    ("cargo", "cargo", ["-V"]),
+    ("rustc", "rustc", ["-V"]),
+    # Cargo subcommands
+    ("tauri", "cargo", ["tauri", "--version"]),
+    ("audit", "cargo", ["audit", "-V"]),
+    ("nextest", "cargo", ["nextest", "--version"]),
+    ("llvm-cov", "cargo", ["llvm-cov", "--version"]),
+]
+
+# Keeps messages from installers running in parallel on separate lines
+OUTPUT_LOCK = threading.Lock()
+
 def info(msg: str) -> None:
-    print(f"{CYAN}[info]{RESET} {msg}")
+    with OUTPUT_LOCK:
+        print(f"{CYAN}[info]{RESET} {msg}")
 
 def warn(msg: str) -> None:
-    print(f"{YELLOW}[warn]{RESET} {msg}")
+    with OUTPUT_LOCK:
+        print(f"{YELLOW}[warn]{RESET} {msg}")
 
 def err(msg: str) -> None:
-    print(f"{RED}[err ]{RESET} {msg}")
+    with OUTPUT_LOCK:
+        print(f"{RED}[err ]{RESET} {msg}")
 
-def command_exists(name: str) -> bool:
-    return shutil.which(name) is not None
+@functools.lru_cache(maxsize=None)
+def command_exists(name: str) -> Optional[str]:
+    """Return the resolved path of a command on PATH, or None (truthy if it exists)."""
+    # Cached; installers call command_exists.cache_clear() once they may have
+    # put a new binary on PATH
+    return shutil.which(name)
 
 def run_cmd(cmd: list[str], check: bool = False, capture: bool = False) -> subprocess.CompletedProcess:
     """Run a command, optionally checking for errors."""
@@ -41,6 +88,20 @@ def run_cmd(cmd: list[str], check: bool = False, capture: bool = False) -> subpr
     except FileNotFoundError:
         return None
 
+def run_parallel(tasks, max_workers: int) -> None:
+    """Run independent installer steps concurrently and wait for all of them."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        for future in futures:
+            future.result()
+
+def run_as_root(*commands: list[str]) -> None:
+    """Run commands in sequence under a single sudo (one prompt, one spawn)."""
+    # ';' rather than '&&': each step still runs if an earlier one fails,
+    # as with separate invocations (e.g. apt-get update on one bad mirror)
+    script = "; ".join(shlex.join(cmd) for cmd in commands)
+    subprocess.run(["sudo", "sh", "-c", script], check=False)
+
 def get_version(cmd: list[str]) -> str:
     """Get version string from a command."""
     try:
@@ -51,12 +112,12 @@ def get_version(cmd: list[str]) -> str:
 
 def ensure_cargo_in_path() -> None:
     """Add cargo bin to PATH if not already present."""
-    cargo_bin = Path.home() / ".cargo" / "bin"
-    if cargo_bin.exists():
-        path_sep = ";" if platform.system() == "Windows" else ":"
-        if str(cargo_bin) not in os.environ.get("PATH", ""):
-            os.environ["PATH"] = f"{cargo_bin}{path_sep}{os.environ.get('PATH', '')}"
-            info(f"Added {cargo_bin} to PATH for current session")
+    if CARGO_BIN.exists():
+        path = os.environ.get("PATH", "")
+        if str(CARGO_BIN) not in path.split(os.pathsep):
+            os.environ["PATH"] = f"{CARGO_BIN}{os.pathsep}{path}"
+            command_exists.cache_clear()
+            info(f"Added {CARGO_BIN} to PATH for current session")
 
 def get_distro_info() -> dict:
     """Get Linux distribution info from /etc/os-release."""
@@ -75,42 +136,42 @@ def get_distro_info() -> dict:
 
 def install_build_tools() -> None:
     """Install build tools on Linux."""
-    if platform.system() != "Linux":
+    if not IS_LINUX:
         return
     
     info("Ensuring build tools are installed")
     
     if command_exists("apt-get"):
-        if not command_exists("cc") or not command_exists("pkg-config"):
+        if not (command_exists("cc") and command_exists("pkg-config") and command_exists("curl")):
             info("Installing build-essential and Tauri dependencies")
-            subprocess.run([
-                "sudo", "apt-get", "update", "-y"
-            ], check=False)
-            subprocess.run([
-                "sudo", "apt-get", "install", "-y",
-                "build-essential", "pkg-config", "libssl-dev",
-                "libgtk-3-dev", "libwebkit2gtk-4.1-dev",
-                "libayatana-appindicator3-dev", "librsvg2-dev"
-            ], check=False)
+            run_as_root(
+                ["apt-get", "update", "-y"],
+                ["apt-get", "install", "-y",
+                 "build-essential", "pkg-config", "curl", "ca-certificates", "libssl-dev",
+                 "libgtk-3-dev", "libwebkit2gtk-4.1-dev",
+                 "libayatana-appindicator3-dev", "librsvg2-dev"],
+            )
     
     elif command_exists("dnf"):
-        if not command_exists("cc") or not command_exists("pkg-config"):
+        if not (command_exists("cc") and command_exists("pkg-config") and command_exists("curl")):
             info("Installing development tools and Tauri dependencies")
-            subprocess.run(["sudo", "dnf", "groupinstall", "-y", "Development Tools"], check=False)
-            subprocess.run([
-                "sudo", "dnf", "install", "-y",
-                "pkg-config", "openssl-devel", "gtk3-devel",
-                "webkit2gtk4.1-devel", "libappindicator-gtk3-devel", "librsvg2-devel"
-            ], check=False)
+            run_as_root(
+                ["dnf", "groupinstall", "-y", "Development Tools"],
+                ["dnf", "install", "-y",
+                 "pkg-config", "curl", "openssl-devel", "gtk3-devel",
+                 "webkit2gtk4.1-devel", "libappindicator-gtk3-devel", "librsvg2-devel"],
+            )
     
     elif command_exists("pacman"):
-        if not command_exists("cc") or not command_exists("pkg-config"):
+        if not (command_exists("cc") and command_exists("pkg-config") and command_exists("curl")):
             info("Installing base-devel and Tauri dependencies")
             subprocess.run([
                 "sudo", "pacman", "-Sy", "--noconfirm",
-                "base-devel", "pkg-config", "openssl",
+                "base-devel", "pkg-config", "curl", "openssl",
                 "gtk3", "webkit2gtk-4.1", "libappindicator-gtk3", "librsvg"
             ], check=False)
+    
+    command_exists.cache_clear()
 
 def install_node() -> None:
     """Install Node.js if not present."""
@@ -118,9 +179,8 @@ def install_node() -> None:
         return
     
     info("Installing Node.js")
-    system = platform.system()
     
-    if system == "Windows":
+    if IS_WINDOWS:
         if command_exists("winget"):
             try:
                 subprocess.run([
@@ -132,20 +192,20 @@ def install_node() -> None:
         else:
             warn("winget not found. Please install Node.js LTS from https://nodejs.org/ and re-run.")
     
-    elif system == "Darwin":  # macOS
+    elif IS_DARWIN:  # macOS
         if command_exists("brew"):
             subprocess.run(["brew", "install", "node"], check=False)
         else:
             warn("Homebrew not found. Please install Node.js from https://nodejs.org/")
     
-    elif system == "Linux":
+    elif IS_LINUX:
         if command_exists("brew"):
             subprocess.run(["brew", "install", "node"], check=False)
         elif command_exists("apt-get"):
-            subprocess.run(["sudo", "apt-get", "update", "-y"], check=False)
-            subprocess.run([
-                "sudo", "apt-get", "install", "-y", "curl", "ca-certificates", "gnupg"
-            ], check=False)
+            run_as_root(
+                ["apt-get", "update", "-y"],
+                ["apt-get", "install", "-y", "curl", "ca-certificates", "gnupg"],
+            )
             # Use NodeSource setup script
             subprocess.run(
                 "curl -fsSL https://deb.nodesource.com/setup_lts.x | sudo -E bash -",
@@ -153,12 +213,16 @@ def install_node() -> None:
             )
             subprocess.run(["sudo", "apt-get", "install", "-y", "nodejs"], check=False)
         elif command_exists("dnf"):
-            subprocess.run(["sudo", "dnf", "module", "enable", "-y", "nodejs:20"], check=False)
-            subprocess.run(["sudo", "dnf", "install", "-y", "nodejs"], check=False)
+            run_as_root(
+                ["dnf", "module", "enable", "-y", "nodejs:20"],
+                ["dnf", "install", "-y", "nodejs"],
+            )
         elif command_exists("pacman"):
             subprocess.run(["sudo", "pacman", "-Sy", "--noconfirm", "nodejs", "npm"], check=False)
         else:
             warn("Please install Node.js LTS from https://nodejs.org/ and re-run.")
+    
+    command_exists.cache_clear()
 
 def activate_pnpm_via_corepack() -> None:
     """Activate pnpm via Corepack."""
@@ -169,13 +233,15 @@ def activate_pnpm_via_corepack() -> None:
     
     info("Activating pnpm via Corepack")
     try:
-        if platform.system() != "Windows" and command_exists("sudo"):
+        if not IS_WINDOWS and command_exists("sudo"):
             subprocess.run(["sudo", "corepack", "enable"], check=False)
         else:
             subprocess.run(["corepack", "enable"], check=False)
         subprocess.run(["corepack", "prepare", "pnpm@latest", "--activate"], check=False)
     except Exception as e:
         warn(f"Corepack activation failed: {e}")
+    
+    command_exists.cache_clear()
 
 def install_npm() -> None:
     """Ensure npm is available via Corepack."""
@@ -186,12 +252,14 @@ def install_npm() -> None:
     
     info("Ensuring npm is available (via Corepack)")
     try:
-        if platform.system() != "Windows" and command_exists("sudo"):
+        if not IS_WINDOWS and command_exists("sudo"):
             subprocess.run(["sudo", "corepack", "enable"], check=False)
         else:
             subprocess.run(["corepack", "enable"], check=False)
     except Exception:
         warn("Could not enable npm via Corepack")
+    
+    command_exists.cache_clear()
 
 def install_rustup() -> None:
     """Install Rust via rustup if not present."""
@@ -199,9 +267,8 @@ def install_rustup() -> None:
         return
     
     info("Installing Rust (rustup)")
-    system = platform.system()
     
-    if system == "Windows":
+    if IS_WINDOWS:
         if command_exists("winget"):
             try:
                 subprocess.run([
@@ -210,6 +277,7 @@ def install_rustup() -> None:
                 ], check=True)
             except subprocess.CalledProcessError:
                 warn("winget rustup install failed")
+            command_exists.cache_clear()
         
         # Fallback to direct download
         if not command_exists("cargo"):
@@ -222,7 +290,7 @@ def install_rustup() -> None:
             except Exception as e:
                 err(f"Failed to install rustup: {e}. Install from https://rustup.rs")
     
-    elif system == "Darwin":  # macOS
+    elif IS_DARWIN:  # macOS
         if command_exists("brew"):
             subprocess.run(["brew", "install", "rustup-init"], check=False)
             subprocess.run(["rustup-init", "-y"], check=False)
@@ -238,11 +306,8 @@ def install_rustup() -> None:
             shell=True, check=False
         )
     
-    # Source cargo env
-    cargo_env = Path.home() / ".cargo" / "env"
-    if cargo_env.exists() and platform.system() != "Windows":
-        subprocess.run(f". {cargo_env}", shell=True, check=False)
-    
+    # ~/.cargo/env only prepends ~/.cargo/bin to PATH; do that in-process
+    command_exists.cache_clear()
     ensure_cargo_in_path()
 
 def ensure_rust_components() -> None:
@@ -254,81 +319,90 @@ def ensure_rust_components() -> None:
     subprocess.run(["rustup", "component", "add", "rustfmt"], check=False)
     subprocess.run(["rustup", "component", "add", "clippy"], check=False)
 
-def ensure_cargo_tool(display: str, check_cmd: list[str], crate: str, args: str = "") -> None:
-    """Install a cargo tool if not present."""
-    # Check if tool exists
+@functools.lru_cache(maxsize=1)
+def installed_cargo_crates() -> frozenset[str]:
+    """Names of crates installed with `cargo install`, from one `cargo install --list`."""
     try:
-        subprocess.run(check_cmd, capture_output=True, check=True, timeout=10)
-        return  # Tool exists
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        pass  # Need to install
+        out = subprocess.run(
+            ["cargo", "install", "--list"], capture_output=True, text=True, check=False
+        ).stdout
+    except FileNotFoundError:
+        return frozenset()
+    # Crate lines look like "tauri-cli v2.0.0:"; their binaries follow indented
+    return frozenset(line.split()[0] for line in out.splitlines() if line and not line[0].isspace())
+
+def ensure_cargo_tools() -> None:
+    """Install missing cargo tools, with one `cargo install` per set of extra args."""
+    groups: dict[str, list[tuple[str, str]]] = {}
+    for display, binary, crate, args in CARGO_TOOLS:
+        # Check if tool exists, without spawning it
+        if crate in installed_cargo_crates() or command_exists(binary):
+            continue
+        if not command_exists("cargo"):
+            warn(f"{display} requires Cargo; skipping (Cargo not found)")
+            continue
+        groups.setdefault(args, []).append((display, crate))
     
-    if not command_exists("cargo"):
-        warn(f"{display} requires Cargo; skipping (Cargo not found)")
-        return
+    # cargo install builds its crates one after another, each with every
+    # core, so memory use and terminal output stay those of a single build
+    for args, tools in groups.items():
+        names = ", ".join(f"{display} ({crate})" for display, crate in tools)
+        info(f"Installing {names}")
+        try:
+            subprocess.run(["cargo", "install", *(crate for _, crate in tools), *args.split()], check=False)
+        except Exception as e:
+            warn(f"Failed to install {names}: {e}")
     
-    info(f"Installing {display} ({crate})")
-    try:
-        cmd = ["cargo", "install", crate]
-        if args:
-            cmd.extend(args.split())
-        subprocess.run(cmd, check=False)
-    except Exception as e:
-        warn(f"Failed to install {display}: {e}")
+    command_exists.cache_clear()
+    installed_cargo_crates.cache_clear()
 
 def print_versions() -> None:
     """Print installed tool versions."""
     print(f"\n{GREEN}==> Versions{RESET}")
     
-    if command_exists("node"):
-        print(f"node    : {get_version(['node', '-v'])}")
-    if command_exists("npm"):
-        print(f"npm     : {get_version(['npm', '-v'])}")
-    if command_exists("pnpm"):
-        print(f"pnpm    : {get_version(['pnpm', '-v'])}")
-    if command_exists("cargo"):
-        print(f"cargo   : {get_version(['cargo', '-V'])}")
-    if command_exists("rustc"):
-        print(f"rustc   : {get_version(['rustc', '-V'])}")
-    
-    # Cargo subcommands
-    tauri_ver = get_version(["cargo", "tauri", "--version"])
-    if tauri_ver:
-        print(f"tauri   : {tauri_ver}")
-    
-    audit_ver = get_version(["cargo", "audit", "-V"])
-    if audit_ver:
-        print(f"audit   : {audit_ver}")
+    # Spawn the resolved binaries directly, all at once
+    probes = []
+    for label, binary, args in VERSION_PROBES:
+        path = command_exists(binary)
+        if path:
+            probes.append((label, [path, *args]))
+    if not probes:
+        return
     
-    nextest_ver = get_version(["cargo", "nextest", "--version"])
-    if nextest_ver:
-        print(f"nextest : {nextest_ver}")
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        versions = list(executor.map(get_version, [cmd for _, cmd in probes]))
     
-    llvmcov_ver = get_version(["cargo", "llvm-cov", "--version"])
-    if llvmcov_ver:
-        print(f"llvm-cov: {llvmcov_ver}")
+    for (label, _), version in zip(probes, versions):
+        if version:
+            print(f"{label:<8}: {version}")
 
 def main() -> int:
     print(f"{GREEN}==> Quickstart: installing prerequisites{RESET}")
     
-    # Linux build tools
+    # Linux build tools (serial: holds the package manager lock)
     install_build_tools()
     
+    # Ask for the sudo password now rather than in the middle of rustup's
+    # output once install_node reaches the package manager
+    if IS_LINUX and command_exists("sudo") and not command_exists("node") and not command_exists("brew"):
+        subprocess.run(["sudo", "-v"], check=False)
+    
+    # Node.js and Rust downloads are independent (curl came with the build
+    # tools). On macOS both go through Homebrew, which refuses to run two
+    # installs at once.
+    run_parallel([install_node, install_rustup],
+                 max_workers=1 if IS_DARWIN else 2)
+    
     # Node.js ecosystem
-    install_node()
     activate_pnpm_via_corepack()
     install_npm()
     
     # Rust ecosystem
-    install_rustup()
     ensure_cargo_in_path()
     ensure_rust_components()
     
     # Cargo tools
-    ensure_cargo_tool("Tauri CLI", ["cargo", "tauri", "--version"], "tauri-cli", "--locked")
-    ensure_cargo_tool("cargo-audit", ["cargo", "audit", "-V"], "cargo-audit")
-    ensure_cargo_tool("cargo-nextest", ["cargo", "nextest", "--version"], "cargo-nextest")
-    ensure_cargo_tool("cargo-llvm-cov", ["cargo", "llvm-cov", "--version"], "cargo-llvm-cov")
+    ensure_cargo_tools()
     
     # Report versions
     print_versions()
@@ -6,42 +6,90 @@ Usage:
     python set_version.py 1.2.3
 """
 
+import mmap
+import os
 import sys
 import re
 from pathlib import Path
 
 
+# Cargo.toml sections whose version = "x.y.z" gets updated
+CARGO_VERSION_SECTIONS = (b'[package]', b'[workspace.package]')
+# version = "..." line inside a section; group 1 is the value
+CARGO_VERSION_LINE_RE = re.compile(rb'^version\s*=\s*"([^"]*)"', re.MULTILINE)
+# "version": "x.y.z" in package.json
+PACKAGE_JSON_VERSION_RE = re.compile(r'"version"\s*:\s*"[^"]*"')
+# "version": "x.y.z" in tauri.conf.json
+TAURI_CONF_VERSION_RE = re.compile(r'("version"\s*:\s*)"[^"]*"')
+
+
+def is_valid_version(version: str) -> bool:
+    """Check for major.minor.patch with plain decimal parts and no leading zeros."""
+    parts = version.split('.')
+    return len(parts) == 3 and all(
+        p.isascii() and p.isdigit() and (p == '0' or not p.startswith('0')) for p in parts
+    )
+
+
+def find_cargo_version(data, header: bytes):
+    """Return the (start, end) byte span of the version value under a section header."""
+    pos = 0
+    while True:
+        idx = data.find(header, pos)
+        if idx == -1:
+            return None
+        # Only a header at the start of a line counts
+        if idx == 0 or data[idx - 1:idx] == b'\n':
+            break
+        pos = idx + 1
+    # The section ends at the next line starting with '['
+    end = data.find(b'\n[', idx + len(header))
+    if end == -1:
+        end = len(data)
+    match = CARGO_VERSION_LINE_RE.search(data, idx, end)
+    return match.span(1) if match else None
+
+
 def update_cargo_toml(file_path: Path, new_version: str) -> bool:
     """Update version in a Cargo.toml file."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        original = content
+        new_bytes = new_version.encode('utf-8')
         
-        # Match version = "x.y.z" in [package] section
-        content = re.sub(
-            r'(^\[package\].*?^version\s*=\s*)"[^"]*"',
-            rf'\1"{new_version}"',
-            content,
-            count=1,
-            flags=re.MULTILINE | re.DOTALL
-        )
+        with open(file_path, 'r+b') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0)
+            except ValueError:
+                # Empty file; nothing to update
+                print(f'[--] No changes in {file_path}')
+                return False
+            
+            with mm:
+                # Match version = "x.y.z" in [package] and [workspace.package] (workspace root)
+                spans = set()
+                for header in CARGO_VERSION_SECTIONS:
+                    span = find_cargo_version(mm, header)
+                    if span and mm[span[0]:span[1]] != new_bytes:
+                        spans.add(span)
+                
+                if not spans:
+                    print(f'[--] No changes in {file_path}')
+                    return False
+                
+                # Same length (e.g. 1.2.3 -> 1.2.4): patch the bytes in place
+                if all(end - start == len(new_bytes) for start, end in spans):
+                    for start, end in spans:
+                        mm[start:end] = new_bytes
+                    mm.flush()
+                    print(f'[OK] Updated {file_path}')
+                    return True
         
-        # Match version = "x.y.z" in [workspace.package] section (workspace root)
-        content = re.sub(
-            r'(^\[workspace\.package\].*?^version\s*=\s*)"[^"]*"',
-            rf'\1"{new_version}"',
-            content,
-            count=1,
-            flags=re.MULTILINE | re.DOTALL
-        )
-        
-        if content != original:
-            file_path.write_text(content, encoding='utf-8')
-            print(f'[OK] Updated {file_path}')
-            return True
-        else:
-            print(f'[--] No changes in {file_path}')
-            return False
+        # Length changes: splice the new value in and rewrite the file
+        content = file_path.read_bytes()
+        for start, end in sorted(spans, reverse=True):
+            content = content[:start] + new_bytes + content[end:]
+        file_path.write_bytes(content)
+        print(f'[OK] Updated {file_path}')
+        return True
     except Exception as e:
         print(f'[ERR] Error updating {file_path}: {e}')
         return False
@@ -52,12 +100,7 @@ def update_package_json(file_path: Path, new_version: str) -> bool:
     try:
         content = file_path.read_text(encoding='utf-8')
         # Match "version": "x.y.z"
-        updated = re.sub(
-            r'"version"\s*:\s*"[^"]*"',
-            f'"version": "{new_version}"',
-            content,
-            count=1
-        )
+        updated = PACKAGE_JSON_VERSION_RE.sub(f'"version": "{new_version}"', content, count=1)
         
         if updated != content:
             file_path.write_text(updated, encoding='utf-8')
@@ -76,12 +119,7 @@ def update_tauri_conf(file_path: Path, new_version: str) -> bool:
     try:
         content = file_path.read_text(encoding='utf-8')
         # Match "version": "x.y.z" in tauri.conf.json
-        updated = re.sub(
-            r'("version"\s*:\s*)"[^"]*"',
-            rf'\1"{new_version}"',
-            content,
-            count=1
-        )
+        updated = TAURI_CONF_VERSION_RE.sub(rf'\1"{new_version}"', content, count=1)
         
         if updated != content:
             file_path.write_text(updated, encoding='utf-8')
@@ -104,7 +142,7 @@ def main():
     new_version = sys.argv[1]
     
     # Validate version format (semver)
-    if not re.match(r'^\d+\.\d+\.\d+$', new_version):
+    if not is_valid_version(new_version):
         print(f'Error: Invalid version format "{new_version}"')
         print('Version must be in format: major.minor.patch (e.g., 1.2.3)')
         sys.exit(1)
@@ -123,19 +161,19 @@ def main():
     ]
     
     for cargo_file in cargo_files:
-        if cargo_file.exists():
+        if os.path.lexists(cargo_file):
             if update_cargo_toml(cargo_file, new_version):
                 updated_count += 1
     
     # Update package.json
     package_json = root / 'gui' / 'package.json'
-    if package_json.exists():
+    if os.path.lexists(package_json):
         if update_package_json(package_json, new_version):
             updated_count += 1
     
     # Update tauri.conf.json (for MSI version)
     tauri_conf = root / 'src-tauri' / 'tauri.conf.json'
-    if tauri_conf.exists():
+    if os.path.lexists(tauri_conf):
         if update_tauri_conf(tauri_conf, new_version):
             updated_count += 1
     
@@ -14,22 +14,45 @@ Options:
     -v, --verbose   Show full output (also logs everything to file with -l)
     -l, --log       Enable logging to timestamped file
     -a, --audit     Run cargo audit
+    -j, --jobs N    Run up to N test stages in parallel (default: all selected)
+    --no-cache      Rerun stages whose inputs are unchanged since they last passed
+    --combined      Run GUI and E2E tests as one pnpm ci:test stage
+    --no-sccache    Don't wrap rustc with sccache even if it is installed
     --all           Run all tests (default if no specific option given)
+    -h, --help      Show this help and exit
+
+Examples:
+  python test.py                    # Run all tests
+  python test.py --rust             # Run Rust tests only
+  python test.py --gui              # Run GUI tests only
+  python test.py --e2e              # Run E2E tests only
+  python test.py --rust --coverage  # Run Rust tests with coverage
+  python test.py --all --verbose    # Run all tests with full output
+  python test.py --log              # Run all tests and log to file
+  python test.py -j 1               # Run stages one after another
+  python test.py --no-cache         # Rerun stages even if nothing changed
+  python test.py --combined         # GUI + E2E through one pnpm ci:test call
+  python test.py --no-sccache       # Compile without the sccache wrapper
 """
 from __future__ import annotations
 
-import argparse
-import glob
-import io
+import asyncio
+import functools
+import hashlib
+import json
 import os
-import platform
 import re
 import shutil
 import subprocess
 import sys
-from datetime import datetime
+import time
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, NoReturn, Optional
+
+if TYPE_CHECKING:
+    import io
 
 # ANSI color codes
 GREEN = "\033[32m"
@@ -38,17 +61,67 @@ RED = "\033[31m"
 CYAN = "\033[36m"
 RESET = "\033[0m"
 
+# Host platform
+IS_WINDOWS = sys.platform == "win32"
+
+# rustup's install location
+CARGO_BIN = Path.home() / ".cargo" / "bin"
+
 # Global state
 VERBOSE: bool = False
 LOG_ENABLED: bool = False
 LOG_FILE: Optional[Path] = None
-LOG_HANDLE: Optional[io.TextIOWrapper] = None
+LOG_HANDLE: Optional[io.BufferedWriter] = None
+# Wrap rustc with sccache when available (--no-sccache turns it off)
+USE_SCCACHE: bool = True
+# CPU share for each side when cargo and pnpm stages run concurrently
+STAGE_CORES: Optional[int] = None
 
 ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+ANSI_ESCAPE_BYTES = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Pipe read size when streaming command output
+STREAM_CHUNK_SIZE = 65536
+
+# Name filter shared by the Rust tests that set CS_PLAYWRIGHT_HTML. cargo test
+# runs tests as threads of one process, so these must not run concurrently
+ENV_VAR_TESTS = "fetch_csrin_playwright"
+
+# Passing stage results, keyed by a hash of the files each stage reads
+CACHE_DIR = Path(".test-cache")
+RUST_INPUTS = ("Cargo.toml", "Cargo.lock", "rust-toolchain.toml", ".cargo", "config",
+               "crates", "src-tauri", "test.py")
+GUI_INPUTS = ("package.json", "pnpm-lock.yaml", "pnpm-workspace.yaml", "gui", "test.py")
+
+# GUI package paths, checked once at startup
+_GUI_DIR = Path("gui")
+_GUI_EXISTS = _GUI_DIR.is_dir()
+_NODE_MODULES = _GUI_DIR / "node_modules"
+
+# Last cargo audit run; the advisory DB is refetched at most once a day
+AUDIT_CACHE = CACHE_DIR / "audit-last.json"
+AUDIT_DB_MAX_AGE = 24 * 60 * 60
+
+# Child environments that cut output at the source when not VERBOSE. The
+# cargo setting also reaches nested cargo calls that never see our -q;
+# CI=1 makes Vitest print compact, non-interactive output
+QUIET_CARGO_ENV = {"CARGO_TERM_QUIET": "true"}
+QUIET_VITEST_ENV = {"CI": "1", "npm_config_loglevel": "error"}
+
+# Log file buffer; flushed at each step, fsynced once on close
+LOG_BUFFER_SIZE = 65536
+
+# Stages running in parallel buffer their (terminal, log) output in their
+# own task context and emit it in one piece when they finish. Everything
+# runs on the event loop thread, so direct writes never interleave either
+_CAPTURE: ContextVar[Optional[tuple[bytearray, bytearray]]] = ContextVar("_CAPTURE", default=None)
 
 
 def strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from text."""
+    # Most lines carry no escapes at all; skip the regex for them
+    if '\x1b' not in text:
+        return text
     return ANSI_ESCAPE.sub('', text)
 
 
@@ -56,87 +129,181 @@ def log_write(text: str) -> None:
     """Write to log file if enabled, stripping ANSI codes."""
     global LOG_HANDLE
     if LOG_HANDLE:
-        LOG_HANDLE.write(strip_ansi(text))
-        LOG_HANDLE.flush()
+        data = strip_ansi(text).encode('utf-8')
+        captured = _CAPTURE.get()
+        if captured is not None:
+            captured[1].extend(data)
+        else:
+            LOG_HANDLE.write(data)
+
+
+def log_write_bytes(data: bytes) -> None:
+    """Write raw command output to the log file, stripping ANSI codes."""
+    if LOG_HANDLE:
+        if b'\r' in data:
+            data = data.replace(b'\r\n', b'\n')
+        if b'\x1b' in data:
+            data = ANSI_ESCAPE_BYTES.sub(b'', data)
+        captured = _CAPTURE.get()
+        if captured is not None:
+            captured[1].extend(data)
+        else:
+            LOG_HANDLE.write(data)
+
+
+def write_stdout_bytes(data: bytes) -> None:
+    """Write raw bytes to the terminal, bypassing the text encoder."""
+    captured = _CAPTURE.get()
+    if captured is not None:
+        captured[0].extend(data)
+        return
+    # Anything print() has buffered must come out first
+    sys.stdout.flush()
+    if IS_WINDOWS:
+        # The console's buffer decodes UTF-8 itself; a raw fd write would
+        # bypass it and show the bytes in the OEM code page
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+        return
+    fd = sys.stdout.fileno()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
 def print_and_log(text: str) -> None:
     """Print to terminal and optionally log."""
-    print(text)
+    print_line(text)
     log_write(text + "\n")
 
 
+def print_line(text: str) -> None:
+    """Print a line, or buffer it while the current stage is captured."""
+    captured = _CAPTURE.get()
+    if captured is not None:
+        captured[0].extend((text + "\n").encode('utf-8'))
+    else:
+        print(text)
+
+
+async def run_captured(stage) -> bool:
+    """Run a stage with its output buffered, then emit it all at once."""
+    out, log = bytearray(), bytearray()
+    token = _CAPTURE.set((out, log))
+    try:
+        return await stage()
+    finally:
+        _CAPTURE.reset(token)
+        write_stdout_bytes(out)
+        if LOG_HANDLE:
+            LOG_HANDLE.write(log)
+            LOG_HANDLE.flush()
+
+
+# (color, prefix) for each message level
+_LEVELS = {
+    "step": (GREEN, "==> "),
+    "info": (CYAN, "    "),
+    "warn": (YELLOW, "    Warning: "),
+    "error": (RED, "    Error: "),
+    "success": (GREEN, "    ✓ "),
+}
+
+
+def _log(level: str, msg: str) -> None:
+    """Print a message at the given level and log it without color."""
+    color, prefix = _LEVELS[level]
+    print_line(f"{color}{prefix}{msg}{RESET}")
+    log_write(f"{prefix}{msg}\n")
+
+
 def step(name: str) -> None:
     """Print a step header."""
-    msg = f"{GREEN}==> {name}{RESET}"
-    print(msg)
-    log_write(f"==> {name}\n")
+    _log("step", name)
+    # Flush at step boundaries so a partial log is still usable
+    if LOG_HANDLE and _CAPTURE.get() is None:
+        LOG_HANDLE.flush()
 
 
 def info(msg: str) -> None:
     """Print info message."""
-    text = f"{CYAN}    {msg}{RESET}"
-    print(text)
-    log_write(f"    {msg}\n")
+    _log("info", msg)
 
 
 def warn(msg: str) -> None:
     """Print warning message."""
-    text = f"{YELLOW}    Warning: {msg}{RESET}"
-    print(text)
-    log_write(f"    Warning: {msg}\n")
+    _log("warn", msg)
 
 
 def error(msg: str) -> None:
     """Print error message."""
-    text = f"{RED}    Error: {msg}{RESET}"
-    print(text)
-    log_write(f"    Error: {msg}\n")
+    _log("error", msg)
 
 
 def success(msg: str) -> None:
     """Print success message."""
-    text = f"{GREEN}    ✓ {msg}{RESET}"
-    print(text)
-    log_write(f"    ✓ {msg}\n")
+    _log("success", msg)
 
 
-def run_cmd(cmd, shell: bool = False, check: bool = True,
-            cwd: Optional[str] = None, quiet: bool = False) -> Optional[subprocess.CompletedProcess]:
+async def run_cmd(cmd, shell: bool = False, check: bool = True,
+                  cwd: Optional[str] = None, quiet: bool = False,
+                  env: Optional[dict[str, str]] = None) -> Optional[subprocess.CompletedProcess]:
     """
     Run a command with output handling.
     
     When VERBOSE: stream output to terminal AND log file
     When quiet and not VERBOSE: suppress stdout
+    env: extra variables layered over the current environment
     """
     global VERBOSE, LOG_HANDLE
     
+    # Popen (which asyncio uses underneath) takes posix_spawn instead of
+    # fork+exec only for an absolute program path, no cwd and close_fds=False.
+    # Leaving fds open is safe: Python creates them non-inheritable (PEP 446),
+    # so the child gets only the pipes. Windows keeps close_fds=True.
+    argv = cmd
+    if not shell and not isinstance(cmd, str):
+        argv = [command_exists(cmd[0]) or cmd[0], *cmd[1:]]
+    if env:
+        env = {**os.environ, **env}
+    
+    if shell:
+        spawn, spawn_args = asyncio.create_subprocess_shell, (argv,)
+    else:
+        spawn, spawn_args = asyncio.create_subprocess_exec, argv
+    
     try:
         if VERBOSE or not quiet:
-            # Stream output in real-time
-            process = subprocess.Popen(
-                cmd,
-                shell=shell,
+            # Stream output in real-time, copying raw chunks through
+            process = await spawn(
+                *spawn_args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
                 cwd=cwd,
-                encoding='utf-8',
-                errors='replace',
-                bufsize=1
+                env=env,
+                close_fds=IS_WINDOWS
             )
+            pending = b''
             
-            for line in process.stdout:
-                try:
-                    print(line, end='')
-                except UnicodeEncodeError:
-                    # Strip non-ASCII for Windows cp1252 compatibility
-                    print(line.encode('ascii', 'replace').decode(), end='')
+            while True:
+                # Returns whatever is available instead of waiting for a full chunk
+                buf = await process.stdout.read(STREAM_CHUNK_SIZE)
+                if not buf:
+                    break
+                write_stdout_bytes(buf)
                 # Log to file when verbose (captures all command output)
-                if VERBOSE:
-                    log_write(line)
+                if VERBOSE and LOG_HANDLE:
+                    # Log whole lines only so escape codes are never split across writes
+                    pending += buf
+                    cut = pending.rfind(b'\n') + 1
+                    if cut:
+                        log_write_bytes(pending[:cut])
+                        pending = pending[cut:]
+            
+            if pending:
+                log_write_bytes(pending)
             
-            process.wait()
+            await process.wait()
             
             if check and process.returncode != 0:
                 raise subprocess.CalledProcessError(process.returncode, cmd)
@@ -145,18 +312,19 @@ def run_cmd(cmd, shell: bool = False, check: bool = True,
         
         else:
             # Quiet mode
-            result = subprocess.run(
-                cmd,
-                shell=shell,
+            process = await spawn(
+                *spawn_args,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
                 cwd=cwd,
-                encoding='utf-8',
-                errors='replace',
-                check=check
+                env=env,
+                close_fds=IS_WINDOWS
             )
-            return result
+            _, stderr = await process.communicate()
+            stderr = stderr.decode('utf-8', errors='replace')
+            if check and process.returncode != 0:
+                raise subprocess.CalledProcessError(process.returncode, cmd, None, stderr)
+            return subprocess.CompletedProcess(cmd, process.returncode, None, stderr)
     
     except subprocess.CalledProcessError as e:
         if check:
@@ -169,27 +337,75 @@ def run_cmd(cmd, shell: bool = False, check: bool = True,
         return None
 
 
-def command_exists(name: str) -> bool:
-    """Check if a command exists in PATH."""
-    return shutil.which(name) is not None
+@functools.lru_cache(maxsize=None)
+def command_exists(name: str) -> Optional[str]:
+    """Return the resolved path of a command on PATH, or None (cached until PATH changes)."""
+    return shutil.which(name)
+
+
+_cargo_path_done = False
 
 
 def ensure_cargo_in_path() -> None:
-    """Add cargo bin to PATH if not already present."""
-    cargo_bin = Path.home() / ".cargo" / "bin"
-    if cargo_bin.exists():
-        path_sep = ";" if platform.system() == "Windows" else ":"
-        if str(cargo_bin) not in os.environ.get("PATH", ""):
-            os.environ["PATH"] = f"{cargo_bin}{path_sep}{os.environ.get('PATH', '')}"
+    """Add cargo bin to PATH if not already present and set up sccache; once per run."""
+    global _cargo_path_done
+    if _cargo_path_done:
+        return
+    # Already resolving to rustup's cargo means ~/.cargo/bin is on PATH. A
+    # distro cargo elsewhere doesn't count: cargo-installed tools (nextest,
+    # audit, llvm-cov) still live in ~/.cargo/bin
+    cargo = command_exists("cargo")
+    if not (cargo and Path(cargo).parent == CARGO_BIN) and CARGO_BIN.exists():
+        path = os.environ.get("PATH", "")
+        # Compare whole entries; a substring test matches e.g. .cargo/binaries
+        if str(CARGO_BIN) not in path.split(os.pathsep):
+            os.environ["PATH"] = f"{CARGO_BIN}{os.pathsep}{path}"
+            command_exists.cache_clear()
+    if USE_SCCACHE:
+        enable_sccache()
+    _cargo_path_done = True
+
+
+def enable_sccache() -> None:
+    """Route rustc through sccache if it's installed and no wrapper is configured."""
+    # An explicit RUSTC_WRAPPER, even an empty one, is the user's choice
+    if "RUSTC_WRAPPER" in os.environ:
+        return
+    sccache = command_exists("sccache")
+    if sccache:
+        os.environ["RUSTC_WRAPPER"] = sccache
+        os.environ.setdefault("SCCACHE_DIR", str(Path.home() / ".cache" / "sccache"))
+
+
+def available_cores() -> int:
+    """Number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def cargo_env(quiet: bool) -> Optional[dict[str, str]]:
+    """Environment overrides for a cargo stage."""
+    env = dict(QUIET_CARGO_ENV) if quiet else {}
+    if STAGE_CORES:
+        # Caps rustc jobs for every cargo build, including nextest's
+        env["CARGO_BUILD_JOBS"] = str(STAGE_CORES)
+    return env or None
 
 
 def cleanup_old_logs(max_logs: int = 3) -> None:
     """Keep only the N most recent log files, delete older ones."""
-    log_pattern = "test-script-*.log"
-    log_files = sorted(glob.glob(log_pattern), key=os.path.getmtime, reverse=True)
+    with os.scandir(".") as it:
+        entries = [
+            (entry.stat().st_mtime, entry.name)
+            for entry in it
+            if entry.name.startswith("test-script-") and entry.name.endswith(".log")
+            and entry.is_file()
+        ]
+    entries.sort(reverse=True)
     
     # Delete all but the most recent max_logs files
-    for old_log in log_files[max_logs:]:
+    for _, old_log in entries[max_logs:]:
         try:
             os.remove(old_log)
         except OSError as e:
@@ -199,35 +415,114 @@ def setup_logging() -> None:
     """Set up log file with UTF-8 encoding."""
     global LOG_FILE, LOG_HANDLE
     
+    from datetime import datetime
+    
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     LOG_FILE = Path(f"test-script-{timestamp}.log")
-    LOG_HANDLE = open(LOG_FILE, "w", encoding="utf-8")
+    # Binary so command output can be logged without a decode/encode round-trip
+    LOG_HANDLE = open(LOG_FILE, "wb", buffering=LOG_BUFFER_SIZE)
     print_and_log(f"Logging to: {LOG_FILE}")
 
 def close_logging() -> None:
-    """Close log file handle."""
+    """Flush, sync and close the log file handle."""
     global LOG_HANDLE
     if LOG_HANDLE:
+        LOG_HANDLE.flush()
+        os.fsync(LOG_HANDLE.fileno())
         LOG_HANDLE.close()
         LOG_HANDLE = None
 
 
+# ============================================================
+# Result Cache
+# ============================================================
+
+def hash_inputs(paths: tuple[str, ...]) -> Optional[str]:
+    """SHA-256 over the names and contents of the files under paths, or None outside git."""
+    # git lists tracked and new untracked files without walking ignored
+    # directories like target/ or node_modules/
+    try:
+        listed = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard", "--", *paths],
+            capture_output=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    
+    # Top-level files (e.g. an ignored Cargo.lock) count even if git skips them
+    names = set(listed.split(b"\0"))
+    names.update(p.encode() for p in paths if os.path.isfile(p))
+    names.discard(b"")
+    
+    digest = hashlib.sha256()
+    for name in sorted(names):
+        digest.update(name + b"\0")
+        try:
+            with open(name, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            # Deleted but still tracked
+            digest.update(b"-")
+    return digest.hexdigest()
+
+
+def cached_stage(name: str, stage, inputs: tuple[str, ...]):
+    """Wrap a stage so it is skipped while its inputs match its last passing run."""
+    cache_file = CACHE_DIR / f"{name.lower().replace(' ', '-')}.json"
+    
+    async def run() -> bool:
+        # Hash off the event loop so other stages keep streaming meanwhile
+        key = await asyncio.get_running_loop().run_in_executor(None, hash_inputs, inputs)
+        if key is not None:
+            try:
+                with open(cache_file, encoding="utf-8") as f:
+                    entry = json.load(f)
+                if entry.get("hash") == key and entry.get("passed"):
+                    # Same header the stage itself prints
+                    step(f"Running {name}")
+                    success(f"[CACHED] Unchanged since the passing run at {entry.get('timestamp')}")
+                    return True
+            except (OSError, ValueError):
+                pass
+        
+        passed = await stage()
+        if passed and key is not None:
+            from datetime import datetime
+            
+            CACHE_DIR.mkdir(exist_ok=True)
+            entry = {"hash": key, "passed": True,
+                     "timestamp": datetime.now().isoformat(timespec="seconds")}
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+        return passed
+    
+    return run
+
+
 # ============================================================
 # Test Functions
 # ============================================================
 
-def run_rust_tests(coverage: bool = False) -> bool:
+async def run_rust_tests(coverage: bool = False) -> bool:
     """Run Rust tests with optional coverage."""
     step("Running Rust Tests")
     
     ensure_cargo_in_path()
     
+    # Leave the other half of the machine to the GUI stages
+    threads = [f"--test-threads={STAGE_CORES}"] if STAGE_CORES else []
+    
     if coverage:
         if command_exists("cargo-llvm-cov"):
             info("Generating coverage report with cargo-llvm-cov...")
             try:
-                # Use --test-threads=1 to prevent race conditions with env var tests
-                run_cmd(["cargo", "llvm-cov", "--workspace", "--html", "--", "--test-threads=1"])
+                # Two passes merged into one report, as with plain cargo test below
+                await run_cmd(["cargo", "llvm-cov", "clean", "--workspace"])
+                await run_cmd(["cargo", "llvm-cov", "--workspace", "--no-report", "--", "--skip", ENV_VAR_TESTS, *threads],
+                        env=cargo_env(quiet=False))
+                await run_cmd(["cargo", "llvm-cov", "--workspace", "--no-report", "--", ENV_VAR_TESTS, "--test-threads=1"],
+                        env=cargo_env(quiet=False))
+                await run_cmd(["cargo", "llvm-cov", "report", "--html"])
                 success("Coverage report generated at target/llvm-cov/html/index.html")
                 return True
             except subprocess.CalledProcessError:
@@ -237,14 +532,15 @@ def run_rust_tests(coverage: bool = False) -> bool:
             warn("cargo-llvm-cov not installed. Install with: cargo install cargo-llvm-cov")
             warn("Falling back to standard tests...")
     
-    # Use nextest if available
+    # Use nextest if available. It runs every test in its own process, so the
+    # env var tests can't race and everything runs in parallel
     if command_exists("cargo-nextest"):
         info("Using cargo-nextest for parallel test execution...")
         try:
             cmd = ["cargo", "nextest", "run", "--workspace"]
             if not VERBOSE:
                 cmd.insert(1, "-q")
-            run_cmd(cmd)
+            await run_cmd([*cmd, *threads], env=cargo_env(quiet=not VERBOSE))
             success("All Rust tests passed")
             return True
         except subprocess.CalledProcessError:
@@ -253,11 +549,14 @@ def run_rust_tests(coverage: bool = False) -> bool:
     else:
         info("Using cargo test (install cargo-nextest for faster parallel tests)")
         try:
-            # Use --test-threads=1 to prevent race conditions with env var tests
-            cmd = ["cargo", "test", "--workspace", "--", "--test-threads=1"]
+            # Everything else in parallel, then the env var tests one at a time
+            cmd = ["cargo", "test", "--workspace"]
             if not VERBOSE:
                 cmd.insert(1, "-q")
-            run_cmd(cmd)
+                cmd.append("--message-format=short")
+            env = cargo_env(quiet=not VERBOSE)
+            await run_cmd([*cmd, "--", "--skip", ENV_VAR_TESTS, *threads], env=env)
+            await run_cmd([*cmd, "--", ENV_VAR_TESTS, "--test-threads=1"], env=env)
             success("All Rust tests passed")
             return True
         except subprocess.CalledProcessError:
@@ -265,34 +564,62 @@ def run_rust_tests(coverage: bool = False) -> bool:
             return False
 
 
-def run_gui_tests(coverage: bool = False) -> bool:
+_GUI_DEPS: Optional[asyncio.Future] = None
+
+
+async def ensure_gui_deps() -> bool:
+    """Install GUI pnpm dependencies if missing; runs at most once per invocation."""
+    # GUI and E2E stages may get here at the same time; both await the one
+    # install task instead of starting their own
+    global _GUI_DEPS
+    if _GUI_DEPS is None:
+        _GUI_DEPS = asyncio.ensure_future(_install_gui_deps())
+    return await _GUI_DEPS
+
+
+async def _install_gui_deps() -> bool:
+    # In a pnpm workspace the package store lives in the workspace root's
+    # node_modules; an aborted install can leave gui/node_modules without it
+    root = _GUI_DIR.parent if os.path.lexists(_GUI_DIR.parent / "pnpm-workspace.yaml") else _GUI_DIR
+    if os.path.lexists(_NODE_MODULES) and os.path.lexists(root / "node_modules" / ".pnpm"):
+        return True
+    
+    info("Installing pnpm dependencies...")
+    cmd = ["pnpm", "--dir", str(_GUI_DIR), "install"]
+    if os.path.lexists(root / "pnpm-lock.yaml"):
+        # Skip lockfile resolution
+        cmd.append("--frozen-lockfile")
+    try:
+        await run_cmd(cmd)
+        return True
+    except subprocess.CalledProcessError:
+        error("Failed to install pnpm dependencies")
+        return False
+
+
+async def run_gui_tests(coverage: bool = False) -> bool:
     """Run GUI unit tests with Vitest."""
     step("Running GUI Tests")
     
-    gui_dir = Path("gui")
-    if not gui_dir.exists():
+    if not _GUI_EXISTS:
         error("GUI directory not found")
         return False
     
-    # Check if node_modules exists
-    node_modules = gui_dir / "node_modules"
-    if not node_modules.exists():
-        info("Installing pnpm dependencies...")
-        try:
-            run_cmd(["pnpm", "install"], cwd=str(gui_dir))
-        except subprocess.CalledProcessError:
-            error("Failed to install pnpm dependencies")
-            return False
+    if not await ensure_gui_deps():
+        return False
+    
+    # Cap Vitest's worker pool to this stage's share of the CPUs
+    workers = ["--minWorkers=1", f"--maxWorkers={STAGE_CORES}"] if STAGE_CORES else []
     
     # Run tests
     try:
         if coverage:
             info("Running Vitest with coverage...")
-            run_cmd(["pnpm", "run", "test:coverage"], cwd=str(gui_dir))
+            await run_cmd(["pnpm", "--dir", str(_GUI_DIR), "run", "test:coverage", *workers], env=None if VERBOSE else QUIET_VITEST_ENV)
             success("GUI tests passed with coverage")
         else:
             info("Running Vitest...")
-            run_cmd(["pnpm", "test"], cwd=str(gui_dir))
+            await run_cmd(["pnpm", "--dir", str(_GUI_DIR), "test", *workers], env=None if VERBOSE else QUIET_VITEST_ENV)
             success("GUI tests passed")
         return True
     except subprocess.CalledProcessError:
@@ -300,41 +627,72 @@ def run_gui_tests(coverage: bool = False) -> bool:
         return False
 
 
-def run_e2e_tests() -> bool:
+def playwright_version() -> str:
+    """Installed @playwright/test version, else the range declared in package.json."""
+    try:
+        with open(_NODE_MODULES / "@playwright" / "test" / "package.json", encoding="utf-8") as f:
+            return json.load(f)["version"]
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        with open(_GUI_DIR / "package.json", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return ""
+    for section in ("dependencies", "devDependencies"):
+        version = manifest.get(section, {}).get("@playwright/test")
+        if version:
+            return version
+    return ""
+
+
+async def ensure_playwright_browsers() -> None:
+    """Install Playwright browsers unless this Playwright version already has them."""
+    # Browsers live in a per-user cache outside node_modules, so the sentinel
+    # is keyed by version and survives reinstalls; a new version misses it
+    key = hashlib.sha256(playwright_version().encode("utf-8")).hexdigest()[:16]
+    sentinel = CACHE_DIR / f"playwright-installed-{key}"
+    if os.path.lexists(sentinel):
+        info("Playwright browsers already installed")
+        return
+    
+    info("Ensuring Playwright browsers are installed...")
+    try:
+        result = await run_cmd(["pnpm", "--dir", str(_GUI_DIR), "exec", "playwright", "install", "--with-deps"], quiet=not VERBOSE, check=False)
+        if result is not None and result.returncode == 0:
+            CACHE_DIR.mkdir(exist_ok=True)
+            for stale in CACHE_DIR.glob("playwright-installed-*"):
+                stale.unlink()
+            sentinel.touch()
+        else:
+            warn("Playwright browser installation may have failed")
+    except (subprocess.CalledProcessError, FileNotFoundError, OSError):
+        warn("Playwright browser installation may have failed")
+
+
+async def run_e2e_tests() -> bool:
     """Run E2E tests with Playwright."""
     step("Running E2E Tests")
     
-    gui_dir = Path("gui")
-    if not gui_dir.exists():
+    if not _GUI_EXISTS:
         error("GUI directory not found")
         return False
     
     # Check if Playwright is installed
-    playwright_config = gui_dir / "playwright.config.ts"
-    if not playwright_config.exists():
+    playwright_config = _GUI_DIR / "playwright.config.ts"
+    if not os.path.lexists(playwright_config):
         warn("Playwright not configured. Skipping E2E tests.")
         return True
     
-    # Check for node_modules
-    node_modules = gui_dir / "node_modules"
-    if not node_modules.exists():
-        info("Installing pnpm dependencies...")
-        try:
-            run_cmd(["pnpm", "install"], cwd=str(gui_dir))
-        except subprocess.CalledProcessError:
-            error("Failed to install pnpm dependencies")
-            return False
+    if not await ensure_gui_deps():
+        return False
     
-    # Install Playwright browsers if needed
-    info("Ensuring Playwright browsers are installed...")
-    try:
-        run_cmd(["pnpm", "exec", "playwright", "install", "--with-deps"], cwd=str(gui_dir), quiet=not VERBOSE, check=False)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        warn("Playwright browser installation may have failed")
+    await ensure_playwright_browsers()
     
     try:
         info("Running Playwright E2E tests...")
-        run_cmd(["pnpm", "run", "test:e2e"], cwd=str(gui_dir))
+        workers = [f"--workers={STAGE_CORES}"] if STAGE_CORES else []
+        await run_cmd(["pnpm", "--dir", str(_GUI_DIR), "run", "test:e2e", *workers])
         success("E2E tests passed")
         return True
     except subprocess.CalledProcessError:
@@ -342,16 +700,125 @@ def run_e2e_tests() -> bool:
         return False
 
 
-def run_audit() -> bool:
+async def run_gui_e2e_tests() -> bool:
+    """Run Vitest and Playwright back to back with one pnpm ci:test call."""
+    step("Running GUI + E2E Tests")
+    
+    if not _GUI_EXISTS:
+        error("GUI directory not found")
+        return False
+    
+    if not os.path.lexists(_GUI_DIR / "playwright.config.ts"):
+        warn("Playwright not configured. Running GUI tests only.")
+        return await run_gui_tests()
+    
+    if not await ensure_gui_deps():
+        return False
+    
+    await ensure_playwright_browsers()
+    
+    # ci:test chains two commands, so the worker caps go through the
+    # environment; both configs read them
+    env = {"VITEST_MAX_WORKERS": str(STAGE_CORES), "PLAYWRIGHT_WORKERS": str(STAGE_CORES)} if STAGE_CORES else None
+    
+    try:
+        info("Running Vitest, then Playwright...")
+        await run_cmd(["pnpm", "--dir", str(_GUI_DIR), "run", "ci:test"], env=env)
+        success("GUI and E2E tests passed")
+        return True
+    except subprocess.CalledProcessError:
+        error("GUI or E2E tests failed")
+        return False
+
+
+async def summarize_audit(cmd: list[str]) -> tuple[Optional[int], bool]:
+    """Run cargo audit with JSON output and print a short summary; returns (exit code, report produced)."""
+    path = command_exists(cmd[0])
+    if not path:
+        error(f"Command not found: {cmd}")
+        return None, False
+    process = await asyncio.create_subprocess_exec(
+        path, *cmd[1:], "--json",
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=IS_WINDOWS
+    )
+    stdout, stderr = await process.communicate()
+    
+    try:
+        report = json.loads(stdout)
+    except ValueError:
+        # No report, e.g. the advisory DB couldn't be fetched; show cargo's own error
+        write_stdout_bytes(stderr)
+        log_write_bytes(stderr)
+        return process.returncode, False
+    
+    vulnerabilities = (report.get("vulnerabilities") or {}).get("list") or []
+    for vuln in vulnerabilities:
+        advisory = vuln.get("advisory") or {}
+        package = vuln.get("package") or {}
+        warn(f"{advisory.get('id')}: {package.get('name')} {package.get('version')} - {advisory.get('title')}")
+    warnings = sum(len(items) for items in (report.get("warnings") or {}).values())
+    deps = (report.get("lockfile") or {}).get("dependency-count", "?")
+    info(f"{len(vulnerabilities)} vulnerabilities, {warnings} warnings in {deps} dependencies")
+    return process.returncode, True
+
+
+async def run_audit(use_cache: bool = True) -> bool:
     """Run cargo audit for security vulnerabilities."""
     step("Running Cargo Audit")
     
+    ensure_cargo_in_path()
+    
     if not command_exists("cargo-audit"):
         warn("cargo-audit not installed. Install with: cargo install cargo-audit")
         return True
     
     try:
-        run_cmd(["cargo", "audit"], check=False)
+        with open(AUDIT_CACHE, encoding="utf-8") as f:
+            last = json.load(f)
+    except (OSError, ValueError):
+        last = {}
+    try:
+        lock_mtime = os.stat("Cargo.lock").st_mtime
+    except OSError:
+        lock_mtime = None
+    
+    # A clean audit stays valid while the advisory DB is fresh and the
+    # dependency set (Cargo.lock) hasn't changed
+    now = time.time()
+    db_fresh = use_cache and now - last.get("fetched", 0) < AUDIT_DB_MAX_AGE
+    if db_fresh and last.get("passed") and lock_mtime is not None and last.get("lock_mtime") == lock_mtime:
+        success("[CACHED] Clean audit against today's advisory DB; Cargo.lock unchanged")
+        return True
+    
+    cmd = ["cargo", "audit"]
+    if db_fresh:
+        cmd.append("--no-fetch")
+    
+    try:
+        if VERBOSE:
+            result = await run_cmd(cmd, check=False)
+            returncode = result.returncode if result is not None else None
+            # Streamed text doesn't say whether the fetch worked; only a
+            # clean run proves the DB is usable
+            reported = returncode == 0
+        else:
+            returncode, reported = await summarize_audit(cmd)
+        
+        if returncode is not None:
+            # Any report (advisories found or not) means the DB was usable,
+            # so restart the clock after a fetch; `passed` only gates the
+            # [CACHED] shortcut. No report means the DB is missing or broken:
+            # clear the clock so the next run fetches instead of --no-fetch
+            passed = returncode == 0
+            if not reported:
+                fetched = 0
+            else:
+                fetched = last.get("fetched", 0) if db_fresh else now
+            entry = {"fetched": fetched, "lock_mtime": lock_mtime, "passed": passed}
+            CACHE_DIR.mkdir(exist_ok=True)
+            with open(AUDIT_CACHE, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+        
         success("Audit completed")
         return True
     except Exception as e:
@@ -359,13 +826,15 @@ def run_audit() -> bool:
         return True  # Don't fail the build for audit issues
 
 
-def run_clippy() -> bool:
+async def run_clippy() -> bool:
     """Run Clippy linter."""
     step("Running Clippy")
     
+    ensure_cargo_in_path()
+    
     try:
         cmd = ["cargo", "clippy", "--all-targets", "--", "-D", "warnings"]
-        run_cmd(cmd)
+        await run_cmd(cmd, env=cargo_env(quiet=False))
         success("Clippy passed")
         return True
     except subprocess.CalledProcessError:
@@ -377,36 +846,95 @@ def run_clippy() -> bool:
 # Main
 # ============================================================
 
+# Boolean flags, by spelling
+FLAGS = {
+    "-r": "rust", "--rust": "rust",
+    "-g": "gui", "--gui": "gui",
+    "-e": "e2e", "--e2e": "e2e",
+    "-c": "clippy", "--clippy": "clippy",
+    "--coverage": "coverage",
+    "-v": "verbose", "--verbose": "verbose",
+    "-l": "log", "--log": "log",
+    "-a": "audit", "--audit": "audit",
+    "--all": "all",
+    "--combined": "combined",
+    "--no-cache": "no_cache",
+    "--no-sccache": "no_sccache",
+}
+
+
+def usage_error(msg: str) -> NoReturn:
+    """Report bad usage and exit with argparse's status code."""
+    sys.stderr.write(f"usage: python test.py [OPTIONS]\ntest.py: error: {msg}\n")
+    raise SystemExit(2)
+
+
+def parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse command-line options; -h prints the module docstring."""
+    args = SimpleNamespace(jobs=None, **dict.fromkeys(FLAGS.values(), False))
+    it = iter(argv)
+    for arg in it:
+        if arg in FLAGS:
+            setattr(args, FLAGS[arg], True)
+            continue
+        if arg in ("-h", "--help"):
+            print(__doc__.strip())
+            raise SystemExit(0)
+        
+        if arg in ("-j", "--jobs"):
+            value = next(it, "")
+        elif arg.startswith("--jobs="):
+            value = arg[len("--jobs="):]
+        elif arg.startswith("-j"):
+            value = arg[2:]
+        elif arg[:1] == "-" and arg[1:2] != "-" and all(f"-{c}" in FLAGS for c in arg[1:]):
+            # Bundled short flags, e.g. -rv
+            for c in arg[1:]:
+                setattr(args, FLAGS[f"-{c}"], True)
+            continue
+        else:
+            usage_error(f"unrecognized arguments: {arg}")
+        
+        if not value.isdigit():
+            usage_error(f"argument -j/--jobs: invalid int value: '{value}'")
+        args.jobs = int(value)
+    return args
+
+
+async def run_stages(stages: dict, jobs: int) -> dict[str, bool]:
+    """Run the stages, up to jobs at a time; results keep the stages' order."""
+    results = dict.fromkeys(stages, False)
+    if jobs <= 1:
+        for name, stage in stages.items():
+            results[name] = await stage()
+        return results
+    
+    info(f"Running {len(stages)} stages, up to {jobs} at a time...")
+    slots = asyncio.Semaphore(jobs)
+    
+    async def run(name: str, stage) -> None:
+        async with slots:
+            # Each stage's output is printed as a block when it finishes
+            results[name] = await run_captured(stage)
+    
+    # One event loop drains every stage's pipes
+    await asyncio.gather(*(run(name, stage) for name, stage in stages.items()))
+    return results
+
+
 def main() -> int:
-    global VERBOSE
+    global VERBOSE, STAGE_CORES, USE_SCCACHE
     
-    parser = argparse.ArgumentParser(
-        description="Run project tests",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python test.py                    # Run all tests
-  python test.py --rust             # Run Rust tests only
-  python test.py --gui              # Run GUI tests only
-  python test.py --e2e              # Run E2E tests only
-  python test.py --rust --coverage  # Run Rust tests with coverage
-  python test.py --all --verbose    # Run all tests with full output
-  python test.py --log              # Run all tests and log to file
-"""
-    )
-    parser.add_argument("-r", "--rust", action="store_true", help="Run Rust tests")
-    parser.add_argument("-g", "--gui", action="store_true", help="Run GUI tests")
-    parser.add_argument("-e", "--e2e", action="store_true", help="Run E2E tests")
-    parser.add_argument("--coverage", action="store_true", help="Generate coverage reports")
-    parser.add_argument("-v", "--verbose", action="store_true", help="Show full output")
-    parser.add_argument("-l", "--log", action="store_true", help="Enable logging to file")
-    parser.add_argument("-a", "--audit", action="store_true", help="Run cargo audit")
-    parser.add_argument("-c", "--clippy", action="store_true", help="Run Clippy linter")
-    parser.add_argument("--all", action="store_true", help="Run all tests (default)")
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
     
     VERBOSE = args.verbose
     LOG_ENABLED = args.log
+    USE_SCCACHE = not args.no_sccache
+    
+    # Legacy Windows consoles can't encode every message character (e.g. the
+    # check mark); substitute instead of raising mid-run
+    if IS_WINDOWS and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(errors="replace")
     
     # Set up logging if enabled
     if LOG_ENABLED:
@@ -419,59 +947,74 @@ Examples:
     has_specific_test = args.rust or args.gui or args.e2e or args.audit or args.clippy
     run_all = args.all or not has_specific_test
     
-    print(f"\n{CYAN}+=========================================+{RESET}")
-    print(f"{CYAN}|     Website Searcher Test Suite       |{RESET}")
-    print(f"{CYAN}+=========================================+{RESET}\n")
+    banner = (
+        "+=========================================+\n"
+        "|     Website Searcher Test Suite       |\n"
+        "+=========================================+"
+    )
+    sys.stdout.write("\n" + "".join(f"{CYAN}{line}{RESET}\n" for line in banner.splitlines()) + "\n")
     
     # Log the test suite header
-    log_write("\n+=========================================+\n")
-    log_write("|     Website Searcher Test Suite       |\n")
-    log_write("+=========================================+\n\n")
+    log_write(f"\n{banner}\n\n")
+    
+    # Stages in summary order; cargo and pnpm stages are independent
+    stages = {}
+    if args.clippy or run_all:
+        stages["Clippy"] = run_clippy
+    if args.rust or run_all:
+        stages["Rust Tests"] = functools.partial(run_rust_tests, coverage=args.coverage)
+    gui = args.gui or run_all
+    e2e = args.e2e or run_all
+    if args.combined and gui and e2e and not args.coverage:
+        # One pnpm startup for both suites
+        stages["GUI + E2E Tests"] = run_gui_e2e_tests
+    else:
+        if gui:
+            stages["GUI Tests"] = functools.partial(run_gui_tests, coverage=args.coverage)
+        if e2e:
+            stages["E2E Tests"] = run_e2e_tests
+    if args.audit or run_all:
+        stages["Audit"] = functools.partial(run_audit, use_cache=not args.no_cache)
     
-    results = {}
+    # Skip stages whose inputs match their last passing run. Coverage runs
+    # exist for their reports, so they are never cached; audit keeps its own
+    # cache tied to the advisory DB age
+    if not args.no_cache and not args.coverage:
+        for name, inputs in (("Clippy", RUST_INPUTS), ("Rust Tests", RUST_INPUTS),
+                             ("GUI Tests", GUI_INPUTS), ("E2E Tests", GUI_INPUTS),
+                             ("GUI + E2E Tests", GUI_INPUTS)):
+            if name in stages:
+                stages[name] = cached_stage(name, stages[name], inputs)
+    
+    jobs = min(args.jobs or len(stages), len(stages))
+    
+    # Cargo stages queue on the build directory lock and so already share
+    # the CPUs; when they overlap pnpm stages, split the cores between the sides
+    if jobs > 1 and stages.keys() & {"Clippy", "Rust Tests"} and stages.keys() & {"GUI Tests", "E2E Tests", "GUI + E2E Tests"}:
+        STAGE_CORES = max(1, available_cores() // 2)
     
     try:
-        # Clippy
-        if args.clippy or run_all:
-            results["Clippy"] = run_clippy()
-        
-        # Rust tests
-        if args.rust or run_all:
-            results["Rust Tests"] = run_rust_tests(coverage=args.coverage)
-        
-        # GUI tests
-        if args.gui or run_all:
-            results["GUI Tests"] = run_gui_tests(coverage=args.coverage)
-        
-        # E2E tests
-        if args.e2e or run_all:
-            results["E2E Tests"] = run_e2e_tests()
-        
-        # Audit
-        if args.audit or run_all:
-            results["Audit"] = run_audit()
-        
-        # Summary
-        print(f"\n{CYAN}========================================={RESET}")
-        print(f"{CYAN}              Test Summary             {RESET}")
-        print(f"{CYAN}========================================={RESET}\n")
-        
-        all_passed = True
-        for name, passed in results.items():
-            if passed:
-                print(f"  {GREEN}[OK]{RESET} {name}")
-            else:
-                print(f"  {RED}[FAIL]{RESET} {name}")
-                all_passed = False
-        
-        print()
+        results = asyncio.run(run_stages(stages, jobs))
         
+        # Summary, written in one go
+        all_passed = all(results.values())
+        lines = [
+            f"\n{CYAN}========================================={RESET}",
+            f"{CYAN}              Test Summary             {RESET}",
+            f"{CYAN}========================================={RESET}\n",
+        ]
+        lines.extend(
+            f"  {GREEN}[OK]{RESET} {name}" if passed else f"  {RED}[FAIL]{RESET} {name}"
+            for name, passed in results.items()
+        )
+        lines.append("")
         if all_passed:
-            print(f"{GREEN}All tests passed!{RESET}\n")
-            return 0
+            lines.append(f"{GREEN}All tests passed!{RESET}\n")
         else:
-            print(f"{RED}Some tests failed.{RESET}\n")
-            return 1
+            lines.append(f"{RED}Some tests failed.{RESET}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        
+        return 0 if all_passed else 1
     
     except KeyboardInterrupt:
         print(f"\n{YELLOW}Tests interrupted{RESET}")